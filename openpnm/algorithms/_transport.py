@@ -158,13 +158,13 @@ class Transport(Algorithm):
             x_BC[ind] = self['pore.bc.value'][ind]
             self.b[~ind] -= (self.A * x_BC)[~ind]
             # Update A
-            P_bc = self.to_indices(ind)
-            mask = np.isin(self.A.row, P_bc) | np.isin(self.A.col, P_bc)
+            P_bc = self.to_indices(ind, as_bool=True)
+            mask = P_bc[self.A.row] | P_bc[self.A.col]
             # Remove entries from A for all BC rows/cols
             self.A.data[mask] = 0
             # Add diagonal entries back into A
             datadiag = self.A.diagonal()
-            datadiag[P_bc] = np.ones_like(P_bc, dtype=float) * f
+            datadiag[P_bc] = f
             self.A.setdiag(datadiag)
             self.A.eliminate_zeros()
 
@@ -1,6 +1,8 @@
 import numpy as np
 import logging
 import uuid
+import weakref
+from collections import defaultdict
 from copy import deepcopy
 from openpnm.core import (
     LabelMixin,
@@ -38,7 +40,9 @@ class BaseSettings:
     Parameters
     ----------
     uuid : str
-        A universally unique identifier for the object to keep things straight
+        A universally unique identifier for the object to keep things straight.
+        This is generated the first time the object's ``uuid`` attribute is
+        accessed.
 
     """
     default_domain = 'domain_1'
@@ -59,9 +63,24 @@ class Base2(dict):
     def __new__(cls, *args, **kwargs):
         instance = super(Base2, cls).__new__(cls, *args, **kwargs)
         # It is necessary to set the SettingsAttr here since some classes
-        # use it before calling super.__init__()
-        instance.settings = SettingsAttr()
-        instance.settings['uuid'] = str(uuid.uuid4())
+        # use it before calling super.__init__().  The fresh instance is not
+        # shared with anything, so it is assigned directly without a copy
+        instance._settings = SettingsAttr()
+        # The uuid is generated lazily by the uuid property
+        instance.settings['uuid'] = None
+        # The number of pores and throats are cached when 'pore.coords' and
+        # 'throat.conns' are written, which can also happen before __init__
+        instance._Np = None
+        instance._Nt = None
+        # Maps each prefix (e.g. 'pore.nested') to the keys nested below it,
+        # using dicts rather than sets to preserve insertion order
+        instance._prefix_index = defaultdict(dict)
+        # Numerical and boolean keys are sorted into props and labels as
+        # they are written, so neither needs to inspect every array
+        instance._props_by_element = {'pore': set(), 'throat': set()}
+        instance._labels_by_element = {'pore': set(), 'throat': set()}
+        # Weak reference to the project, so it need not be searched for
+        instance._project_ref = None
         return instance
 
     def __init__(self, network=None, project=None, name='obj_?'):
@@ -76,11 +95,19 @@ class Base2(dict):
         elif project is None:
             project = network.project
         project.append(self)
+        self._project_ref = weakref.ref(project)
         self.name = name
 
     def __eq__(self, other):
         return hex(id(self)) == hex(id(other))
 
+    def __getstate__(self):
+        # Weak references cannot be pickled, and a copy belongs to a new
+        # project anyway, so the reference is found again when needed
+        state = self.__dict__.copy()
+        state.pop('_project_ref', None)
+        return state
+
     def __repr__(self):  # pragma: no cover
         module = self.__module__
         module = ".".join([x for x in module.split(".") if not x.startswith("_")])
@@ -93,42 +120,39 @@ class Base2(dict):
 
         # Intercept parameters
         if key.startswith('param'):
-            _, key = key.split('.', 1)
+            _, _, key = key.partition('.')
             self._params[key] = value
             return
 
-        if not (key.startswith('pore.') or key.startswith('throat.')):
+        if not key.startswith(('pore.', 'throat.')):
             raise Exception("All dict names must start with pore, throat, or param")
 
         # Intercept @ symbol
         if '@' in key:
-            element, prop = key.split('@')[0].split('.', 1)
-            domain = key.split('@')[1]
+            head, _, domain = key.partition('@')
+            element, _, prop = head.partition('.')
             locs = super().__getitem__(f'{element}.{domain}')
-            try:
-                vals = self[f'{element}.{prop}']
+            if head in self.keys():  # Write into the existing array in place
+                vals = super().__getitem__(head)
                 vals[locs] = value
-                self[f'{element}.{prop}'] = vals
-            except KeyError:
-                value = np.array(value)
+            else:
+                value = np.asanyarray(value)
                 temp = self._initialize_empty_array_like(value, element)
-                self.__setitem__(f'{element}.{prop}', temp)
-                self[f'{element}.{prop}'][locs] = value
+                temp[locs] = value
+                self.__setitem__(head, temp)
             return
 
-        element, prop = key.split('.', 1)
+        element = key.partition('.')[0]
         # Catch dictionaries and break them up
         if isinstance(value, dict):
             for k, v in value.items():
                 self[f'{key}.{k}'] = v
             return
 
-        # Enforce correct dict naming
-        if element not in ['pore', 'throat']:
-            raise Exception('All keys must start with either pore or throat')
-        # Convert value to ndarray
-        if not isinstance(value, np.ndarray):
-            value = np.array(value, ndmin=1)
+        # Convert value to ndarray, passing arrays and subclasses through as is
+        value = np.asanyarray(value)
+        if value.ndim == 0:
+            value = value[None]
         # Skip checks for coords and conns
         if key in ['pore.coords', 'throat.conns']:
             self.update({key: value})
@@ -137,8 +161,10 @@ class Base2(dict):
         if self._count(element) is None:
             self.update({key: value})  # If length not defined, do it
         elif value.shape[0] == 1:  # If value is scalar
-            value = np.ones((self._count(element), ), dtype=value.dtype)*value
-            self.update({key: value})
+            arr = np.empty((self._count(element), *value.shape[1:]),
+                           dtype=value.dtype)
+            arr[:] = value  # Broadcast fill, avoids multiplying by ones
+            self.update({key: arr})
         elif np.shape(value)[0] == self._count(element):
             self.update({key: value})
         else:
@@ -152,7 +178,7 @@ class Base2(dict):
             return key
 
         if key.startswith('param'):
-            _, key = key.split('.', 1)
+            _, _, key = key.partition('.')
             try:
                 return self._params[key]
             except KeyError:
@@ -161,27 +187,26 @@ class Base2(dict):
         # If key contains an @ symbol then return a subset of values at the
         # requested locations, by recursively calling __getitem__
         if '@' in key:
-            element, prop = key.split('@')[0].split('.', 1)
-            domain = key.split('@')[1]
+            head, _, domain = key.partition('@')
+            element, _, prop = head.partition('.')
             if f'{element}.{domain}' not in self.keys():
                 raise KeyError(key)
             locs = self[f'{element}.{domain}']
-            vals = self[f'{element}.{prop}']
+            vals = self[head]
             return vals[locs]
 
         try:
             return super().__getitem__(key)
         except KeyError:
             # If key is object's name or all, return ones
-            if key.split('.', 1)[-1] in [self.name, 'all']:
-                element, prop = key.split('.', 1)
+            element, _, prop = key.partition('.')
+            if prop in [self.name, 'all']:
                 vals = np.ones(self._count(element), dtype=bool)
                 return vals
             else:
                 vals = {}  # Gather any arrays into a dict
-                for k in self.keys():
-                    if k.startswith(f'{key}.'):
-                        vals.update({k.replace(f'{key}.', ''): self[k]})
+                for k in self._prefix_index.get(key, ()):
+                    vals.update({k[len(key)+1:]: self[k]})
                 if len(vals) > 0:
                     return vals
                 else:
@@ -190,14 +215,18 @@ class Base2(dict):
     def __delitem__(self, key):
         try:
             super().__delitem__(key)
+            self._untrack_key(key)
         except KeyError:
             d = self[key]  # If key is a nested dict, get all values
             for item in d.keys():
                 super().__delitem__(f'{key}.{item}')
+                self._untrack_key(f'{key}.{item}')
 
     def pop(self, *args):
         r"""
         """
+        if args[0] in self.keys():
+            self._untrack_key(args[0])
         v = super().pop(*args)
         if v is None:
             try:
@@ -206,10 +235,61 @@ class Base2(dict):
                 for item in d.keys():
                     key = f'{args[0]}.{item}'
                     v[key] = super().pop(key)
+                    self._untrack_key(key)
             except KeyError:
                 pass
         return v
 
+    def update(self, *args, **kwargs):
+        r"""
+        An overloaded version of ``update`` which keeps the cached pore and
+        throat counts, the index of nested key prefixes, and the sets of
+        props and labels in sync with the data being written
+        """
+        d = dict(*args, **kwargs)
+        super().update(d)
+        for k, v in d.items():
+            self._track_key(k, v)
+
+    def _track_key(self, key, value):
+        if key == 'pore.coords':
+            self._Np = np.shape(value)[0]
+        elif key == 'throat.conns':
+            self._Nt = np.shape(value)[0]
+        for prefix in self._iter_prefixes(key):
+            self._prefix_index[prefix][key] = None
+        element, _, prop = key.partition('.')
+        if (element in self._props_by_element) and not prop.startswith('_'):
+            if getattr(value, 'dtype', None) == bool:
+                self._props_by_element[element].discard(key)
+                self._labels_by_element[element].add(key)
+            else:
+                self._labels_by_element[element].discard(key)
+                self._props_by_element[element].add(key)
+
+    def _untrack_key(self, key):
+        if key == 'pore.coords':
+            self._Np = None
+        elif key == 'throat.conns':
+            self._Nt = None
+        for prefix in self._iter_prefixes(key):
+            keys = self._prefix_index.get(prefix, {})
+            keys.pop(key, None)
+            if len(keys) == 0:
+                self._prefix_index.pop(prefix, None)
+        element = key.partition('.')[0]
+        if element in self._props_by_element:
+            self._props_by_element[element].discard(key)
+            self._labels_by_element[element].discard(key)
+
+    @staticmethod
+    def _iter_prefixes(key):
+        # 'pore.nested.name' yields 'pore' and 'pore.nested'
+        i = key.find('.')
+        while i > 0:
+            yield key[:i]
+            i = key.find('.', i + 1)
+
     def clear(self, mode=None):
         r"""
         Clears or deletes certain things from object. If no arguments are provided
@@ -235,6 +315,12 @@ class Base2(dict):
         """
         if mode is None:
             super().clear()
+            self._Np = None
+            self._Nt = None
+            self._prefix_index.clear()
+            for element in ['pore', 'throat']:
+                self._props_by_element[element].clear()
+                self._labels_by_element[element].clear()
         else:
             if isinstance(mode, str):
                 mode = [mode]
@@ -315,8 +401,15 @@ class Base2(dict):
     name = property(_get_name, _set_name)
 
     def _get_project(self):
+        # The reference is cleared when the object leaves its project or the
+        # project is closed, so a live reference can be trusted as is
+        if self._project_ref is not None:
+            proj = self._project_ref()
+            if proj is not None:
+                return proj
         for proj in list(ws.values()):
             if self in proj:
+                self._project_ref = weakref.ref(proj)
                 return proj
 
     project = property(fget=_get_project)
@@ -334,6 +427,16 @@ class Base2(dict):
 
     settings = property(fget=_get_settings, fset=_set_settings, fdel=_del_settings)
 
+    @property
+    def uuid(self):
+        r"""
+        A universally unique identifier for the object, which is generated
+        and stored in ``settings['uuid']`` when first requested
+        """
+        if self.settings['uuid'] is None:
+            self.settings['uuid'] = str(uuid.uuid4())
+        return self.settings['uuid']
+
     @property
     def network(self):
         r"""
@@ -354,6 +457,8 @@ class Base2(dict):
 
     def _count(self, element):
         if element == 'pore':
+            if self._Np is not None:
+                return self._Np
             try:
                 return self['pore.coords'].shape[0]
             except KeyError:
@@ -361,6 +466,8 @@ class Base2(dict):
                     if k.startswith('pore.'):
                         return v.shape[0]
         elif element == 'throat':
+            if self._Nt is not None:
+                return self._Nt
             try:
                 return self['throat.conns'].shape[0]
             except KeyError:
@@ -420,18 +527,23 @@ class Base2(dict):
 
         """
         if pores is not None:
-            indices = np.array(pores, ndmin=1)
+            indices = np.asarray(pores)
             N = self.Np
         elif throats is not None:
-            indices = np.array(throats, ndmin=1)
+            indices = np.asarray(throats)
             N = self.Nt
         else:
             raise Exception('Must specify either pores or throats')
+        if indices.ndim == 0:
+            indices = indices[None]
+        # A full length boolean mask is already in the requested format
+        if (indices.dtype == bool) and (indices.shape[0] == N):
+            return indices.copy()
         mask = np.zeros((N, ), dtype=bool)
         mask[indices] = True
         return mask
 
-    def to_indices(self, mask):
+    def to_indices(self, mask, as_bool=False):
         r"""
         Converts a boolean mask to pore or throat indices
 
@@ -441,20 +553,30 @@ class Base2(dict):
             A boolean mask with `True` values indicating either pore or
             throat indices. This array must either be Nt or Np long, otherwise
             an Exception is raised.
+        as_bool : bool
+            If ``True`` the validated boolean mask is returned as is, without
+            being converted to indices. The default is ``False``.
 
         Returns
         -------
         indices : ndarray
-            An array containing numerical indices of where `mask` was `True`.
+            An array containing numerical indices of where `mask` was `True`,
+            or the boolean mask itself if `as_bool` is ``True``.
 
         Notes
         -----
         This function is equivalent to just calling `np.where(mask)[0]` but
         does check to ensure that `mask` is a valid length.
+
+        When the result is only used to index into an array it is faster to
+        index with the boolean mask directly, since `np.where` must first scan
+        the mask to build the integer array. Use `as_bool=True` in this case.
         """
-        mask = np.array(mask, dtype=bool)
+        mask = np.asarray(mask, dtype=bool)
         if mask.shape[0] not in [self.Np, self.Nt]:
             raise Exception('Mask must be either Nt or Np long')
+        if as_bool:
+            return mask
         return np.where(mask)[0]
 
     def props(self, element=['pore', 'throat']):
@@ -478,10 +600,8 @@ class Base2(dict):
         if isinstance(element, str):
             element = [element]
         props = []
-        for k, v in self.items():
-            el, prop = k.split('.', 1)
-            if (el in element) and (v.dtype != bool) and not prop.startswith('_'):
-                props.append(k)
+        for el in element:
+            props.extend(self._props_by_element.get(el, []))
         props = sorted(props)
         props = PrintableList(props)
         return props
@@ -535,22 +655,30 @@ class Base2(dict):
             for pore1, throat, and pore2 respectively.
 
         """
-        poreprop = 'pore.' + propname.split('.', 1)[-1]
-        throatprop = 'throat.' + propname.split('.', 1)[-1]
-        conns = self.network.conns
+        prop = propname.split('.', 1)[-1]
+        poreprop = 'pore.' + prop
+        throatprop = 'throat.' + prop
+        # Look up the network once, since self.Nt may also need it on phases
+        conns = self.network['throat.conns']
+        Nt = conns.shape[0]
         try:
             T = self[throatprop]
             if T.ndim > 1:
                 raise Exception(f'{throatprop} must be a single column wide')
         except KeyError:
-            T = np.ones([self.Nt, ], dtype=float)*np.nan
+            T = np.full((Nt, ), np.nan)
         try:
-            P1, P2 = self[poreprop][conns.T]
+            P = self[poreprop]
+            P1 = P[conns[:, 0]]
+            P2 = P[conns[:, 1]]
         except KeyError:
-            P1 = np.ones([self.Nt, ], dtype=float)*np.nan
-            P2 = np.ones([self.Nt, ], dtype=float)*np.nan
-        vals = np.vstack((P1, T, P2)).T
-        if np.isnan(vals).sum() == vals.size:
+            P1 = P2 = np.full((Nt, ), np.nan)
+        # Write columns directly into a C-contiguous Nt-by-3 array
+        vals = np.empty((Nt, 3), dtype=np.result_type(P1, T, P2))
+        vals[:, 0] = P1
+        vals[:, 1] = T
+        vals[:, 2] = P2
+        if np.all(np.isnan(vals)):
             raise KeyError(f'{propname} not found')
         return vals
 
@@ -566,13 +694,17 @@ class Base2(dict):
 
     def _initialize_empty_array_like(self, value, element):
         element = element.split('.', 1)[0]
-        value = np.array(value)
+        value = np.asarray(value)
+        shape = (self._count(element), *value.shape[1:])
         if value.dtype == bool:
-            temp = np.zeros([self._count(element), *value.shape[1:]],
-                            dtype=bool)
+            temp = np.zeros(shape, dtype=bool)
         else:
-            temp = np.zeros([self._count(element), *value.shape[1:]],
-                            dtype=float)*np.nan
+            # Keep complex and wider float dtypes, but only for numbers
+            if value.dtype.kind in 'biufc':
+                dtype = np.result_type(value.dtype, float)
+            else:
+                dtype = float
+            temp = np.full(shape, np.nan, dtype=dtype)
         return temp
 
 
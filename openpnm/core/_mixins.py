@@ -280,10 +280,8 @@ class LabelMixin:
             if isinstance(element, str):
                 element = [element]
             labels = PrintableList()
-            for k, v in self.items():
-                el, prop = k.split('.', 1)
-                if (el in element) and (v.dtype == bool) and not prop.startswith('_'):
-                    labels.append(k)
+            for el in element:
+                labels.extend(self._labels_by_element.get(el, []))
         elif (np.size(pores) > 0) and (np.size(throats) > 0):
             raise Exception('Cannot perform label query on pores and '
                             + 'throats simultaneously')
@@ -366,10 +364,10 @@ class LabelMixin:
             _ = self.pop('pore.' + label, None)
             _ = self.pop('throat.' + label, None)
 
-    def _get_indices(self, element, labels, mode='or'):
+    def _get_mask(self, element, labels, mode='or'):
         r"""
-        This is the actual method for getting indices, but should not be called
-        directly.  Use ``pores`` or ``throats`` instead.
+        This is the actual method for finding the locations of labels, but
+        should not be called directly.  Use ``pores`` or ``throats`` instead.
         """
         # Parse and validate all input values.
         element = self._parse_element(element, single=True)
@@ -412,6 +410,14 @@ class LabelMixin:
             ind = (xnor > 1)
         else:
             raise Exception('Unsupported mode: '+mode)
+        return ind
+
+    def _get_indices(self, element, labels, mode='or'):
+        r"""
+        This is the actual method for getting indices, but should not be called
+        directly.  Use ``pores`` or ``throats`` instead.
+        """
+        ind = self._get_mask(element=element, labels=labels, mode=mode)
         # Extract indices from boolean mask
         ind = np.where(ind)[0]
         ind = ind.astype(dtype=int)
@@ -473,9 +479,9 @@ class LabelMixin:
         """
         if labels is None:
             labels = self.name
-        ind = self._get_indices(element='pore', labels=labels, mode=mode)
         if asmask:
-            ind = self.to_mask(pores=ind)
+            return self._get_mask(element='pore', labels=labels, mode=mode)
+        ind = self._get_indices(element='pore', labels=labels, mode=mode)
         return ind
 
     def throats(self, labels=None, mode='or', asmask=False):
@@ -525,9 +531,9 @@ class LabelMixin:
         """
         if labels is None:
             labels = self.name
-        ind = self._get_indices(element='throat', labels=labels, mode=mode)
         if asmask:
-            ind = self.to_mask(throats=ind)
+            return self._get_mask(element='throat', labels=labels, mode=mode)
+        ind = self._get_indices(element='throat', labels=labels, mode=mode)
         return ind
 
     def filter_by_label(self, pores=[], throats=[], labels=None, mode='or'):
@@ -641,8 +647,8 @@ class LabelMixin:
 
         """
         # Count number of pores of specified type
-        Ps = self._get_indices(labels=labels, mode=mode, element='pore')
-        Np = np.shape(Ps)[0]
+        mask = self._get_mask(labels=labels, mode=mode, element='pore')
+        Np = np.count_nonzero(mask)
         return Np
 
     def num_throats(self, labels='all', mode='union'):
@@ -692,6 +698,6 @@ class LabelMixin:
 
         """
         # Count number of pores of specified type
-        Ts = self._get_indices(labels=labels, mode=mode, element='throat')
-        Nt = np.shape(Ts)[0]
+        mask = self._get_mask(labels=labels, mode=mode, element='throat')
+        Nt = np.count_nonzero(mask)
         return Nt
@@ -34,6 +34,42 @@ class ModelsDict(PrintableDict):
     ``dependency_graph``, and ``dependency_map``.
 
     """
+    _propname_index = None
+
+    def _get_domain_keys(self, propname):
+        r"""
+        Returns the keys of all models which compute ``propname``, i.e.
+        ``'pore.diameter'`` gives ``['pore.diameter@left', ...]``. The lookup
+        table is cached until the models are changed.
+        """
+        if self._propname_index is None:
+            index = {}
+            for k in self.keys():
+                name, sep, _ = k.partition('@')
+                if sep:
+                    index.setdefault(name, []).append(k)
+            self._propname_index = index
+        return self._propname_index.get(propname, [])
+
+    def __setitem__(self, key, value):
+        self._propname_index = None
+        super().__setitem__(key, value)
+
+    def pop(self, *args):
+        self._propname_index = None
+        return super().pop(*args)
+
+    def popitem(self):
+        self._propname_index = None
+        return super().popitem()
+
+    def setdefault(self, *args):
+        self._propname_index = None
+        return super().setdefault(*args)
+
+    def clear(self):
+        self._propname_index = None
+        super().clear()
 
     def _find_target(self):
         """
@@ -69,8 +105,9 @@ class ModelsDict(PrintableDict):
         import networkx as nx
 
         dtree = self.dependency_graph()
-        cycles = list(nx.simple_cycles(dtree))
-        if cycles:
+        # Only enumerate the cycles for the error message if there are any
+        if not nx.is_directed_acyclic_graph(dtree):
+            cycles = list(nx.simple_cycles(dtree))
             msg = 'Cyclic dependency: ' + ' -> '.join(cycles[0] + [cycles[0][0]])
             raise Exception(msg)
         d = nx.algorithms.dag.lexicographical_topological_sort(dtree, sorted)
@@ -211,6 +248,7 @@ class ModelsDict(PrintableDict):
         return '\n'.join(lines)
 
     def __delitem__(self, key):
+        self._propname_index = None
         if '@' in key:
             super().__delitem__(key)
         else:  # Delete all models with the same prefix
@@ -223,9 +261,8 @@ class ModelsDict(PrintableDict):
             return super().__getitem__(key)
         except KeyError:
             d = PrintableDict(key='Model', value='Args')
-            for k, v in self.items():
-                if k.startswith(key+'@'):
-                    d[k] = v
+            for k in self._get_domain_keys(key):
+                d[k] = super().__getitem__(k)
             if len(d) > 0:
                 return d
             else:
@@ -245,14 +282,50 @@ class ModelWrapper(dict):
     This class is used to hold individual models and provide some extra
     functionality, such as pretty-printing and the ability to run itself.
     """
+    _cached_kwargs = None
 
     def __call__(self):
         model = self['model']
-        kwargs = {}
-        for k, v in self.items():
-            if k not in ['model', 'regen_mode']:
-                kwargs[k] = v
-        return model(self.target, **kwargs)
+        return model(self.target, **self._kwargs)
+
+    @property
+    def _kwargs(self):
+        r"""
+        The arguments to pass to the model, which are all entries except
+        'model' and 'regen_mode'. These are cached until an entry is changed.
+        """
+        if self._cached_kwargs is None:
+            self._cached_kwargs = {k: v for k, v in self.items()
+                                   if k not in ['model', 'regen_mode']}
+        return self._cached_kwargs
+
+    def __setitem__(self, key, value):
+        self._cached_kwargs = None
+        super().__setitem__(key, value)
+
+    def __delitem__(self, key):
+        self._cached_kwargs = None
+        super().__delitem__(key)
+
+    def update(self, *args, **kwargs):
+        self._cached_kwargs = None
+        super().update(*args, **kwargs)
+
+    def pop(self, *args):
+        self._cached_kwargs = None
+        return super().pop(*args)
+
+    def popitem(self):
+        self._cached_kwargs = None
+        return super().popitem()
+
+    def setdefault(self, *args):
+        self._cached_kwargs = None
+        return super().setdefault(*args)
+
+    def clear(self):
+        self._cached_kwargs = None
+        super().clear()
 
     @property
     def name(self):
@@ -501,20 +574,16 @@ class ModelsMixin2:
                 propname, _, domain = propname.partition('@')
                 self.run_model(propname=propname, domain=domain)
             else:  # No domain means run model for ALL domains
-                for item in self.models.keys():
-                    if item.startswith(propname+"@"):
-                        _, _, domain = item.partition("@")
-                        self.run_model(propname=propname, domain=domain)
+                for item in list(self.models._get_domain_keys(propname)):
+                    _, _, domain = item.partition("@")
+                    self.run_model(propname=propname, domain=domain)
         else:  # domain was given explicitly
             domain = domain.split('.', 1)[-1]
             element, prop = propname.split('@')[0].split('.', 1)
             propname = f'{element}.{prop}'
             mod_dict = self.models[propname+'@'+domain]
             # Collect kwargs
-            kwargs = {'domain': f'{element}.{domain}'}
-            for item in mod_dict.keys():
-                if item not in ['model', 'regen_mode']:
-                    kwargs[item] = mod_dict[item]
+            kwargs = {'domain': f'{element}.{domain}', **mod_dict._kwargs}
             # Deal with models that don't have domain argument yet
             if 'domain' not in inspect.getfullargspec(mod_dict['model']).args:
                 _ = kwargs.pop('domain', None)
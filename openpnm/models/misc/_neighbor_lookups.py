@@ -50,32 +50,32 @@ def from_neighbor_throats(target, prop, mode='min', ignore_nans=True):
     network = target.network
     data = target[prop]
     nans = np.isnan(data)
-    im = network.create_incidence_matrix()
+    # Each throat contributes its value to both of the pores it connects, so
+    # scatter the repeated throat values onto the flattened conns directly
+    Ps = network['throat.conns'].ravel()
+    Np = network.Np
     if mode == 'min':
         if ignore_nans:
-            data[nans] = np.inf
-        values = np.ones((network.Np, ))*np.inf
-        np.minimum.at(values, im.row, data[im.col])
+            data = np.where(nans, np.inf, data)
+        values = np.full((Np, ), np.inf)
+        np.minimum.at(values, Ps, np.repeat(data, 2))
     if mode == 'max':
         if ignore_nans:
-            data[nans] = -np.inf
-        values = np.ones((network.Np, ))*-np.inf
-        np.maximum.at(values, im.row, data[im.col])
+            data = np.where(nans, -np.inf, data)
+        values = np.full((Np, ), -np.inf)
+        np.maximum.at(values, Ps, np.repeat(data, 2))
     if mode == 'mean':
         if ignore_nans:
-            data[nans] = 0
-        values = np.zeros((network.Np, ))
-        np.add.at(values, im.row, data[im.col])
-        counts = np.zeros((network.Np, ))
-        np.add.at(counts, im.row, np.ones((network.Nt, ))[im.col])
-        if ignore_nans:
-            np.subtract.at(counts, im.row, nans[im.col])
+            data = np.where(nans, 0, data)
+            counts = np.bincount(Ps, weights=np.repeat(~nans, 2), minlength=Np)
+        else:
+            counts = np.bincount(Ps, minlength=Np).astype(float)
+        values = np.bincount(Ps, weights=np.repeat(data, 2), minlength=Np)
         values = values/counts
     if mode == 'sum':
         if ignore_nans:
-            data[nans] = 0
-        values = np.zeros((network.Np, ))
-        np.add.at(values, im.row, data[im.col])
+            data = np.where(nans, 0, data)
+        values = np.bincount(Ps, weights=np.repeat(data, 2), minlength=Np)
     return values
 
 
@@ -195,12 +195,11 @@ def random(network, element, seed=None, num_range=[0, 1]):
     -------
 
     """
-    range_size = num_range[1] - num_range[0]
-    range_min = num_range[0]
-    if seed is not None:
-        np.random.seed(seed)
-    value = np.random.rand(network._count(element),)
-    value = value*range_size + range_min
+    # A seeded Generator avoids resetting numpy's global random state, while
+    # the unseeded case still honours any np.random.seed set by the user
+    rng = np.random if seed is None else np.random.default_rng(seed)
+    value = rng.uniform(num_range[0], num_range[1],
+                        size=network._count(element))
     return value
 
 
@@ -58,13 +58,13 @@ class Phase(Domain):
             super().__setitem__(key, value)
         else:
             # Deal with the fact that the label might only exist on the network
-            propname, domain = key.split('@')
-            element, prop = propname.split('.', 1)
+            propname, _, domain = key.partition('@')
+            element, _, prop = propname.partition('.')
             try:  # Fetch array from self if present
-                temp = self[element + '.' + prop]
+                temp = self[propname]
             except KeyError:  # Otherwise create it
                 temp = self._initialize_empty_array_like(value, element)
-                self[element + '.' + prop] = temp
+                self[propname] = temp
             # Insert values into masked locations
             mask = self.project._get_locations(element + '.' + domain)
             temp[mask] = value
@@ -533,14 +533,23 @@ def get_printable_props(item, suffix='', hr=78*'―'):
             prop = k + suffix
             s[5:5+len(prop)] = prop
             element = k.split('.', 1)[0]
-            nans = np.any(np.isnan(np.atleast_2d(v.T)), axis=0)
-            valid = str(np.sum(~nans)) + ' / ' + str(item._count(element))
+            valid = str(_count_defined(v)) + ' / ' + str(item._count(element))
             s[-20:] = valid.rjust(20)
             a = ''.join(s)
             lines = '\n'.join((lines, a))
     return lines
 
 
+def _count_defined(arr):
+    r"""
+    Counts the number of rows in ``arr`` which contain no ``nan`` values
+    """
+    if arr.ndim == 1:
+        return arr.size - np.count_nonzero(np.isnan(arr))
+    nans = np.isnan(arr).any(axis=tuple(range(1, arr.ndim)))
+    return arr.shape[0] - np.count_nonzero(nans)
+
+
 def get_printable_labels(item, suffix='', hr=78*'―'):
     r"""
     This function is used by the __str__ methods on all classes to get a
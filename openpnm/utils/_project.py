@@ -83,6 +83,32 @@ class Project(list):
                         return item
             raise KeyError(key)
 
+    def remove(self, obj):
+        super().remove(obj)
+        self._release([obj])
+
+    def pop(self, *args):
+        obj = super().pop(*args)
+        self._release([obj])
+        return obj
+
+    def __delitem__(self, key):
+        objs = super().__getitem__(key)
+        super().__delitem__(key)
+        self._release(objs if isinstance(key, slice) else [objs])
+
+    def clear(self):
+        objs = list(self)
+        super().clear()
+        self._release(objs)
+
+    def _release(self, objs):
+        # Objects keep a weak reference to their project (see Base2), which
+        # must be cleared once they are no longer part of it
+        for obj in objs:
+            if getattr(obj, '_project_ref', None) is not None:
+                obj._project_ref = None
+
     def copy(self, name=None):
         r"""
         Creates a deep copy of the current project
@@ -113,6 +113,22 @@ class Workspace(dict):
         self.settings = WorkspaceSettings()
         self.settings.loglevel = 30
 
+    def pop(self, *args):
+        project = super().pop(*args)
+        if hasattr(project, '_release'):
+            project._release(project)
+        return project
+
+    def __delitem__(self, name):
+        project = super().pop(name)
+        project._release(project)
+
+    def clear(self):
+        projects = list(self.values())
+        super().clear()
+        for project in projects:
+            project._release(project)
+
     def copy(self):
         """Brief explanation of 'copy'"""
         raise Exception('Cannot copy Workspace, only one can exist at a time')
@@ -259,7 +275,9 @@ class Workspace(dict):
         r"""
         Removes the specified Project from the Workspace
 
-        This does not save the project, so any changes will be lost.
+        This does not save the project, so any changes will be lost. The
+        objects in the project are no longer associated with it, so their
+        ``project`` attribute returns ``None``.
 
         Parameters
         ----------
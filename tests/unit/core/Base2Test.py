@@ -5,8 +5,8 @@ import numpy as np
 
 def random_seed(target, domain, seed=None, lim=[0, 1]):
     inds = target[domain]
-    np.random.seed(seed)
-    seeds = np.random.rand(inds.sum())*(lim[1]-lim[0]) + lim[0]
+    rng = np.random.default_rng(seed)
+    seeds = rng.uniform(lim[0], lim[1], size=np.count_nonzero(inds))
     return seeds
 
 
@@ -16,7 +16,7 @@ def factor(target, prop, f=1):
 
 
 def dolittle(target, domain):
-    N = target[domain].sum()
+    N = np.count_nonzero(target[domain])
     d = {}
     d['item1'] = np.ones([N, ])
     d['item2'] = np.ones([N, ])*2
@@ -146,6 +146,111 @@ class Base2Test:
         assert g['pore.dict3.item1@left'].sum() == 3
         assert g['pore.dict3.item1@right'].sum() == 3
 
+    def test_cached_counts(self):
+        pn = op.network.Cubic(shape=[3, 3, 3])
+        assert pn.Np == 27
+        assert pn.Nt == 54
+        op.topotools.trim(network=pn, pores=[0, 1])
+        assert pn.Np == 25
+        assert pn.Nt == pn['throat.conns'].shape[0]
+        op.topotools.extend(network=pn, coords=[[5, 5, 5]])
+        assert pn.Np == 26
+        coords = pn.pop('pore.coords')
+        assert pn.Np == 26  # Falls back to counting other pore arrays
+        pn['pore.coords'] = coords[:-1]
+        assert pn.Np == 25
+
+    def test_nested_keys_after_update_and_pop(self):
+        pn = op.network.Cubic(shape=[3, 3, 1])
+        pn.update({'pore.nested.a': np.ones(pn.Np),
+                   'pore.nested.deeper.b': np.zeros(pn.Np)})
+        assert list(pn['pore.nested'].keys()) == ['a', 'deeper.b']
+        assert list(pn['pore.nested.deeper'].keys()) == ['b']
+        pn.pop('pore.nested.a')
+        assert list(pn['pore.nested'].keys()) == ['deeper.b']
+        del pn['pore.nested.deeper']
+        with pytest.raises(KeyError):
+            pn['pore.nested']
+
+    def test_props_and_labels_follow_dtype(self):
+        pn = op.network.Cubic(shape=[3, 3, 1])
+        pn['pore.flip'] = 1.0
+        assert 'pore.flip' in pn.props()
+        assert 'pore.flip' not in pn.labels()
+        pn['pore.flip'] = True
+        assert 'pore.flip' not in pn.props()
+        assert 'pore.flip' in pn.labels()
+        pn['pore._hidden'] = 1.0
+        assert 'pore._hidden' not in pn.props()
+        del pn['pore.flip']
+        assert 'pore.flip' not in pn.labels()
+        assert pn.props(element='throat') == ['throat.conns']
+
+    def test_setitem_does_not_copy_arrays(self):
+        pn = op.network.Cubic(shape=[3, 3, 1])
+        arr = np.ones(pn.Np)
+        pn['pore.arr'] = arr
+        assert pn['pore.arr'] is arr
+        pn['pore.zero_dim'] = np.array(2.0)
+        assert np.all(pn['pore.zero_dim'] == 2.0)
+        assert pn['pore.zero_dim'].shape == (pn.Np, )
+        masked = np.ma.masked_array(np.ones(pn.Np), mask=pn['pore.left'])
+        pn['pore.masked'] = masked
+        assert pn['pore.masked'] is masked
+
+    def test_project_lookup(self):
+        pn = op.network.Cubic(shape=[3, 3, 1])
+        proj = pn.project
+        assert pn in proj
+        proj2 = proj.copy()
+        pn2 = proj2.network
+        assert pn2.project is proj2
+        assert pn.project is proj
+        op.Workspace().close_project(proj)
+        assert pn._project_ref is None
+        assert pn.project is None
+        assert pn2.project is proj2
+        proj2.remove(pn2)
+        assert pn2._project_ref is None
+        assert pn2.project is None
+
+    def test_project_lookup_skips_workspace_search(self):
+        ws = op.Workspace()
+        pn = op.network.Cubic(shape=[3, 3, 1])
+        proj = pn.project
+        # Hide the project from the workspace without releasing its objects,
+        # so it can only be found through the stored reference
+        dict.pop(ws, proj.name)
+        try:
+            assert pn.project is proj
+        finally:
+            ws[proj.name] = proj
+
+    def test_domain_write_keeps_complex_dtype(self):
+        pn = op.network.Cubic(shape=[3, 3, 1])
+        pn['pore.c@left'] = 1+2j
+        assert np.iscomplexobj(pn['pore.c'])
+        assert np.all(pn['pore.c@left'] == 1+2j)
+        assert np.isnan(pn['pore.c']).sum() == pn.Np - pn.num_pores('left')
+
+    def test_assigned_settings_are_not_shared(self):
+        pn = op.network.Cubic(shape=[3, 3, 1])
+        s = op.utils.SettingsAttr()
+        s.items = [1]
+        pn.settings = s
+        s.items.append(2)
+        assert pn.settings.items == [1]
+
+    def test_lazy_uuid(self):
+        pn = op.network.Cubic(shape=[3, 3, 1])
+        assert pn.settings['uuid'] is None
+        uid = pn.uuid
+        assert isinstance(uid, str)
+        assert pn.settings['uuid'] == uid
+        assert pn.uuid == uid
+        pn2 = op.network.Cubic(shape=[3, 3, 1])
+        assert pn2.uuid != uid
+
 
 if __name__ == '__main__':
 
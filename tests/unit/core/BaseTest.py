@@ -199,6 +199,14 @@ class BaseTest:
         a = self.net.to_mask(pores=self.net.pores('top'))
         assert np.sum(a) == 9
 
+    def test_tomask_scalar_and_mask(self):
+        a = self.net.to_mask(pores=3)
+        assert np.sum(a) == 1
+        assert a[3]
+        b = self.net.to_mask(pores=a)
+        assert np.all(a == b)
+        assert b is not a
+
     # def test_tomask_throats(self):
     #     self.geo['throat.label1'] = False
     #     self.geo['throat.label1'][[0, 1, 2, 3, 4, 5]] = True
@@ -230,6 +238,12 @@ class BaseTest:
         inds_out = self.net.to_indices(mask*1.0)
         assert np.all(inds_in == inds_out)
 
+    def test_toindices_as_bool(self):
+        mask = (np.random.rand(self.net.Np) < 0.5)
+        a = self.net.to_indices(mask*1.0, as_bool=True)
+        assert a.dtype == bool
+        assert np.all(a == mask)
+
     # def test_toindices_invalid_mask(self):
     #     mask = self.net.Np
     #     with pytest.raises(Exception):
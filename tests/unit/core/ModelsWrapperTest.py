@@ -41,6 +41,37 @@ class ModelsTest:
         e = self.net['pore.diameter'].copy()
         assert not np.any(b == e)
 
+    def test_kwargs_refreshed_when_changed(self):
+        mod = self.net.models['pore.seed@all']
+        assert 'model' not in mod._kwargs
+        assert 'regen_mode' not in mod._kwargs
+        mod['num_range'] = [0.5, 0.5]
+        assert mod._kwargs['num_range'] == [0.5, 0.5]
+        self.net.run_model('pore.seed')
+        assert np.all(self.net['pore.seed'] == 0.5)
+
+    def test_domain_keys_follow_changes(self):
+        net = op.network.Demo([4, 4, 1])
+        assert net.models._get_domain_keys('pore.seed') == ['pore.seed@all']
+        net.add_model(propname='pore.seed@left',
+                      model=op.models.misc.constant,
+                      value=2.0)
+        assert len(net.models['pore.seed']) == 2
+        del net.models['pore.seed@all']
+        assert net.models._get_domain_keys('pore.seed') == ['pore.seed@left']
+        net['pore.seed'] = 0.0
+        net.run_model('pore.seed')
+        assert net['pore.seed'].sum() == 2.0*net.num_pores('left')
+
+    def test_dependency_list_with_cycle(self):
+        net = op.network.Demo([4, 4, 1])
+        net.add_model(propname='pore.a', model=op.models.misc.scaled,
+                      prop='pore.b', regen_mode='deferred')
+        net.add_model(propname='pore.b', model=op.models.misc.scaled,
+                      prop='pore.a', regen_mode='deferred')
+        with pytest.raises(Exception, match='Cyclic dependency'):
+            net.models.dependency_list()
+
 
 
 
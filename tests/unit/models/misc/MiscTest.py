@@ -178,6 +178,15 @@ class MiscTest:
                                               0.18181818, 0.18181818,
                                               0.27272727, 0.27272727]))
 
+    def test_neighbor_throats_with_nans_leaves_data_intact(self):
+        net = op.network.Cubic(shape=[2, 2, 2])
+        net['throat.values'] = np.linspace(0, 1, net.Nt)
+        net['throat.values'][0] = np.nan
+        f = mods.from_neighbor_throats
+        for mode in ['min', 'max', 'mean', 'sum']:
+            f(net, prop='throat.values', ignore_nans=True, mode=mode)
+            assert np.isnan(net['throat.values'][0])
+
     def test_neighbor_throats_mode_max_with_nans(self):
         net = op.network.Cubic(shape=[2, 2, 2])
         net['throat.values'] = np.linspace(0, 1, net.Nt)